@@ -1,234 +1,331 @@
 #!/usr/bin/env python3
 """
 Create sample Excel template files for testing Excel rendering examples.
-"""
+Also builds the plan comparison template from create-plan-comparison-template.py,
+so the whole template set is regenerated in one process.
 
-try:
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-except ImportError:
-    print("Installing openpyxl...")
-    import subprocess
-    subprocess.check_call(["pip", "install", "openpyxl", "-q"])
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+Templates that are newer than the scripts that build them (the builder's own
+script and excel_template_helpers.py) are skipped; run with --force to rebuild
+every template.
+"""
 
+import importlib.util
+import inspect
 import os
+import subprocess
+import sys
 
-# Create templates directory if not exists
-os.makedirs("src/main/resources/common-templates/templates", exist_ok=True)
+if importlib.util.find_spec("openpyxl") is None:
+    print("Installing openpyxl...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "openpyxl", "-q"])
+    importlib.invalidate_caches()
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+
+import excel_template_helpers
+from excel_template_helpers import save_template, set_column_widths
+
+TEMPLATES_DIR = "src/main/resources/common-templates/templates"
+
+# The plan comparison script's file name is not importable, so load it from its path
+_spec = importlib.util.spec_from_file_location(
+    "create_plan_comparison_template",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "create-plan-comparison-template.py"),
+)
+plan_comparison = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(plan_comparison)
+
+# Shared style objects - built once and assigned by reference to every cell
+_HEADER_FONT = Font(bold=True, size=12, color="FFFFFF")
+_HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+_HEADER_ALIGN = Alignment(horizontal="center", vertical="center")
+_DATA_ALIGN = Alignment(horizontal="left", vertical="center")
+_TITLE_FONT = Font(bold=True, size=16)
+_LABEL_FONT = Font(bold=True)
+_SECTION_FONT = Font(bold=True, size=12)
+_TOTAL_FILL = PatternFill(start_color="E8F4EA", end_color="E8F4EA", fill_type="solid")
 
 def style_header(cell, text=""):
     """Apply header styling to a cell"""
-    cell.font = Font(bold=True, size=12, color="FFFFFF")
-    cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    cell.alignment = Alignment(horizontal="center", vertical="center")
+    cell.font = _HEADER_FONT
+    cell.fill = _HEADER_FILL
+    cell.alignment = _HEADER_ALIGN
     if text:
         cell.value = text
     return cell
 
 def style_data(cell, value=""):
     """Apply data cell styling"""
-    cell.alignment = Alignment(horizontal="left", vertical="center")
+    cell.alignment = _DATA_ALIGN
     if value:
         cell.value = value
     return cell
 
-# =============================================================================
-# 1. Personal Form Template
-# =============================================================================
-print("Creating personal-form.xlsx...")
-wb = Workbook()
-ws = wb.active
-ws.title = "Personal Info"
-
-# Headers
-style_header(ws['A1'], "First Name")
-style_header(ws['B1'], "Last Name")
-style_header(ws['C1'], "Email")
-
-# Data rows (leave empty for filling)
-for row in range(2, 10):
-    style_data(ws[f'A{row}'])
-    style_data(ws[f'B{row}'])
-    style_data(ws[f'C{row}'])
+def data_row(ws, width):
+    """
+    Create a row of data-styled cells. Write-only sheets serialise a row as
+    soon as it is appended, so the same row can be appended repeatedly.
+    """
+    return tuple(data_cell(ws) for _ in range(width))
 
-ws.column_dimensions['A'].width = 20
-ws.column_dimensions['B'].width = 20
-ws.column_dimensions['C'].width = 30
+def header_cell(ws, text=""):
+    """Create a header-styled cell ready to be appended to a write-only sheet"""
+    return style_header(WriteOnlyCell(ws), text)
 
-wb.save("src/main/resources/common-templates/templates/personal-form.xlsx")
-print("✅ personal-form.xlsx created")
+def data_cell(ws, value=""):
+    """Create a data-styled cell ready to be appended to a write-only sheet"""
+    return style_data(WriteOnlyCell(ws), value)
 
 # =============================================================================
-# 2. Employee Roster Template
+# 1. Personal Form Template
 # =============================================================================
-print("Creating employee-roster.xlsx...")
-wb = Workbook()
-ws = wb.active
-ws.title = "Employees"
-
-# Headers
-style_header(ws['A1'], "Employee ID")
-style_header(ws['B1'], "First Name")
-style_header(ws['C1'], "Last Name")
-style_header(ws['D1'], "Email")
-style_header(ws['E1'], "Department")
-
-# Data rows (leave empty for filling)
-for row in range(2, 52):
-    for col in ['A', 'B', 'C', 'D', 'E']:
-        style_data(ws[f'{col}{row}'])
-
-ws.column_dimensions['A'].width = 15
-ws.column_dimensions['B'].width = 18
-ws.column_dimensions['C'].width = 18
-ws.column_dimensions['D'].width = 25
-ws.column_dimensions['E'].width = 20
-
-wb.save("src/main/resources/common-templates/templates/employee-roster.xlsx")
-print("✅ employee-roster.xlsx created")
+def build_personal_form(path):
+    """Build personal-form.xlsx at the given path"""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title="Personal Info")
 
-# =============================================================================
-# 3. Invoice Template
-# =============================================================================
-print("Creating invoice-template.xlsx...")
-wb = Workbook()
-ws = wb.active
-ws.title = "Invoice"
+    # Column widths must be set before the first row is streamed
+    set_column_widths(ws, {'A': 20, 'B': 20, 'C': 30})
+    blank_row = data_row(ws, 3)
 
-# Title
-title_cell = ws['A1']
-title_cell.value = "INVOICE"
-title_cell.font = Font(bold=True, size=16)
-ws.merge_cells('A1:D1')
+    # Headers
+    ws.append([
+        header_cell(ws, "First Name"),
+        header_cell(ws, "Last Name"),
+        header_cell(ws, "Email"),
+    ])
 
-# Header Info
-style_header(ws['A3'], "Invoice #")
-style_data(ws['B3'])
+    # Data rows (leave empty for filling)
+    for row in range(2, 10):
+        ws.append(blank_row)
 
-style_header(ws['C3'], "Invoice Date")
-style_data(ws['D3'])
+    save_template(wb, path)
 
-style_header(ws['A4'], "Due Date")
-style_data(ws['B4'])
 
-style_header(ws['C4'], "Customer")
-style_data(ws['D4'])
+# =============================================================================
+# 2. Employee Roster Template
+# =============================================================================
+def build_employee_roster(path):
+    """Build employee-roster.xlsx at the given path"""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title="Employees")
 
-# Line items header
-style_header(ws['A6'], "Description")
-style_header(ws['B6'], "Quantity")
-style_header(ws['C6'], "Unit Price")
-style_header(ws['D6'], "Total")
+    set_column_widths(ws, {'A': 15, 'B': 18, 'C': 18, 'D': 25, 'E': 20})
+    blank_row = data_row(ws, 5)
 
-# Line items rows (leave empty for filling)
-for row in range(7, 27):
-    for col in ['A', 'B', 'C', 'D']:
-        style_data(ws[f'{col}{row}'])
+    # Headers
+    ws.append([
+        header_cell(ws, "Employee ID"),
+        header_cell(ws, "First Name"),
+        header_cell(ws, "Last Name"),
+        header_cell(ws, "Email"),
+        header_cell(ws, "Department"),
+    ])
 
-# Summary section
-style_header(ws['A28'], "Subtotal")
-style_data(ws['B28'])
+    # Data rows (leave empty for filling)
+    for row in range(2, 52):
+        ws.append(blank_row)
 
-style_header(ws['A29'], "Tax")
-style_data(ws['B29'])
+    save_template(wb, path)
 
-style_header(ws['A30'], "TOTAL")
-total_cell = ws['B30']
-total_cell.font = Font(bold=True, size=12)
-total_cell.fill = PatternFill(start_color="E8F4EA", end_color="E8F4EA", fill_type="solid")
 
-ws.column_dimensions['A'].width = 25
-ws.column_dimensions['B'].width = 15
-ws.column_dimensions['C'].width = 15
-ws.column_dimensions['D'].width = 15
+# =============================================================================
+# 3. Invoice Template
+# =============================================================================
+def build_invoice_template(path):
+    """Build invoice-template.xlsx at the given path"""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title="Invoice")
+
+    set_column_widths(ws, {'A': 25, 'B': 15, 'C': 15, 'D': 15})
+    blank_row = data_row(ws, 4)
+
+    # Title
+    title_cell = WriteOnlyCell(ws, value="INVOICE")
+    title_cell.font = _TITLE_FONT
+    ws.append([title_cell])
+    ws.merged_cells.add('A1:D1')
+    ws.append([])
+
+    # Header Info
+    ws.append([
+        header_cell(ws, "Invoice #"),
+        data_cell(ws),
+        header_cell(ws, "Invoice Date"),
+        data_cell(ws),
+    ])
+    ws.append([
+        header_cell(ws, "Due Date"),
+        data_cell(ws),
+        header_cell(ws, "Customer"),
+        data_cell(ws),
+    ])
+    ws.append([])
+
+    # Line items header
+    ws.append([
+        header_cell(ws, "Description"),
+        header_cell(ws, "Quantity"),
+        header_cell(ws, "Unit Price"),
+        header_cell(ws, "Total"),
+    ])
+
+    # Line items rows (leave empty for filling)
+    for row in range(7, 27):
+        ws.append(blank_row)
+    ws.append([])
+
+    # Summary section
+    ws.append([header_cell(ws, "Subtotal"), data_cell(ws)])
+    ws.append([header_cell(ws, "Tax"), data_cell(ws)])
+
+    total_cell = WriteOnlyCell(ws)
+    total_cell.font = _SECTION_FONT
+    total_cell.fill = _TOTAL_FILL
+    ws.append([header_cell(ws, "TOTAL"), total_cell])
+
+    save_template(wb, path)
 
-wb.save("src/main/resources/common-templates/templates/invoice-template.xlsx")
-print("✅ invoice-template.xlsx created")
 
 # =============================================================================
 # 4. Generic Template (for range/row examples)
 # =============================================================================
-print("Creating template.xlsx...")
-wb = Workbook()
-ws = wb.active
-ws.title = "Data"
-
-# Headers for range examples
-style_header(ws['A1'], "Item Names")
-style_header(ws['B1'], "Item Prices")
-style_header(ws['C1'], "Item Code")
-
-# Pre-fill some placeholder data
-for row in range(2, 7):
-    style_data(ws[f'A{row}'])
-    style_data(ws[f'B{row}'])
-    style_data(ws[f'C{row}'])
-
-# Row headers
-style_header(ws['B10'], "Header 1")
-style_header(ws['C10'], "Header 2")
-style_header(ws['D10'], "Header 3")
-style_header(ws['E10'], "Header 4")
-
-# Matrix example (rows 13-15)
-ws['A12'].value = "Matrix Example"
-ws['A12'].font = Font(bold=True)
-
-for row in range(13, 16):
-    for col in ['A', 'B', 'C']:
-        style_data(ws[f'{col}{row}'])
-
-ws.column_dimensions['A'].width = 20
-ws.column_dimensions['B'].width = 15
-ws.column_dimensions['C'].width = 15
-ws.column_dimensions['D'].width = 15
-ws.column_dimensions['E'].width = 15
-
-wb.save("src/main/resources/common-templates/templates/template.xlsx")
-print("✅ template.xlsx created")
+def build_generic_template(path):
+    """Build template.xlsx at the given path"""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title="Data")
+
+    set_column_widths(ws, {'A': 20, 'B': 15, 'C': 15, 'D': 15, 'E': 15})
+    blank_row = data_row(ws, 3)
+
+    # Headers for range examples
+    ws.append([
+        header_cell(ws, "Item Names"),
+        header_cell(ws, "Item Prices"),
+        header_cell(ws, "Item Code"),
+    ])
+
+    # Pre-fill some placeholder data
+    for row in range(2, 7):
+        ws.append(blank_row)
+
+    # Rows 7-9 are left blank
+    for row in range(7, 10):
+        ws.append([])
+
+    # Row headers
+    ws.append([
+        None,
+        header_cell(ws, "Header 1"),
+        header_cell(ws, "Header 2"),
+        header_cell(ws, "Header 3"),
+        header_cell(ws, "Header 4"),
+    ])
+    ws.append([])
+
+    # Matrix example (rows 13-15)
+    label_cell = WriteOnlyCell(ws, value="Matrix Example")
+    label_cell.font = _LABEL_FONT
+    ws.append([label_cell])
+
+    for row in range(13, 16):
+        ws.append(blank_row)
+
+    save_template(wb, path)
+
 
 # =============================================================================
 # 5. Employee Table Template (for table population example)
 # =============================================================================
-print("Creating employee-table.xlsx...")
-wb = Workbook()
-ws = wb.active
-ws.title = "Roster"
-
-# Add some description at top
-ws['A1'].value = "Employee Information"
-ws['A1'].font = Font(bold=True, size=12)
-
-# Headers at row 2
-style_header(ws['A2'], "ID")
-style_header(ws['B2'], "Name")
-style_header(ws['C2'], "Department")
-style_header(ws['D2'], "Salary")
-
-# Empty data rows for population
-for row in range(3, 25):
-    for col in ['A', 'B', 'C', 'D']:
-        style_data(ws[f'{col}{row}'])
-
-ws.column_dimensions['A'].width = 12
-ws.column_dimensions['B'].width = 22
-ws.column_dimensions['C'].width = 20
-ws.column_dimensions['D'].width = 15
-
-wb.save("src/main/resources/common-templates/templates/employee-table.xlsx")
-print("✅ employee-table.xlsx created")
-
-print("\n" + "="*60)
-print("✅ All sample Excel templates created successfully!")
-print("="*60)
-print("\nTemplates created in:")
-print("  src/main/resources/common-templates/templates/")
-print("\nFiles created:")
-print("  - personal-form.xlsx")
-print("  - employee-roster.xlsx")
-print("  - invoice-template.xlsx")
-print("  - template.xlsx")
-print("  - employee-table.xlsx")
-print("\nReady to use with Excel rendering examples!")
+def build_employee_table(path):
+    """Build employee-table.xlsx at the given path"""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title="Roster")
+
+    set_column_widths(ws, {'A': 12, 'B': 22, 'C': 20, 'D': 15})
+    blank_row = data_row(ws, 4)
+
+    # Add some description at top
+    caption_cell = WriteOnlyCell(ws, value="Employee Information")
+    caption_cell.font = _SECTION_FONT
+    ws.append([caption_cell])
+
+    # Headers at row 2
+    ws.append([
+        header_cell(ws, "ID"),
+        header_cell(ws, "Name"),
+        header_cell(ws, "Department"),
+        header_cell(ws, "Salary"),
+    ])
+
+    # Empty data rows for population
+    for row in range(3, 25):
+        ws.append(blank_row)
+
+    save_template(wb, path)
+
+
+# Output file name -> builder
+TEMPLATE_BUILDERS = {
+    "personal-form.xlsx": build_personal_form,
+    "employee-roster.xlsx": build_employee_roster,
+    "invoice-template.xlsx": build_invoice_template,
+    "template.xlsx": build_generic_template,
+    "employee-table.xlsx": build_employee_table,
+    "comparison-template.xlsx": plan_comparison.create_comparison_template,
+}
+
+def _is_up_to_date(builder, path):
+    """True if the template at path is newer than every source file its builder depends on"""
+    sources = (inspect.getsourcefile(builder), excel_template_helpers.__file__)
+    return (os.path.exists(path)
+            and os.path.getmtime(path) >= max(os.path.getmtime(src) for src in sources))
+
+def _dispatch(builder, path):
+    """Run one template builder and return the name of the file it wrote"""
+    builder(path)
+    return os.path.basename(path)
+
+if __name__ == "__main__":
+    # Create templates directory if not exists
+    os.makedirs(TEMPLATES_DIR, exist_ok=True)
+
+    # Templates newer than their generating scripts are reused; pass --force to rebuild all
+    force = "--force" in sys.argv[1:]
+    jobs, skipped = [], []
+    for name, builder in TEMPLATE_BUILDERS.items():
+        path = os.path.join(TEMPLATES_DIR, name)
+        if not force and _is_up_to_date(builder, path):
+            skipped.append(name)
+        else:
+            jobs.append((builder, path))
+
+    created = []
+    for builder, path in jobs:
+        # Announce each template before building it, so a failure is attributable
+        sys.stdout.write(f"Creating {os.path.basename(path)}...\n")
+        sys.stdout.flush()
+        created.append(_dispatch(builder, path))
+
+    # Collect the report and emit it in one write rather than a flush per line
+    lines = [f"✅ {name} created" for name in created]
+    lines += [f"⏭  {name} up to date (use --force to rebuild)" for name in skipped]
+    if created:
+        lines += [
+            "",
+            "="*60,
+            "✅ All sample Excel templates created successfully!",
+            "="*60,
+            "",
+            "Templates created in:",
+            f"  {TEMPLATES_DIR}/",
+            "",
+            "Files created:",
+        ]
+        lines += [f"  - {name}" for name in created]
+        lines += ["", "Ready to use with Excel rendering examples!"]
+    else:
+        lines.append(f"All templates in {TEMPLATES_DIR}/ are up to date (use --force to rebuild)")
+    sys.stdout.write("\n".join(lines) + "\n")
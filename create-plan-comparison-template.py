@@ -9,48 +9,75 @@ This template is designed to be filled with a 2D matrix where:
 import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 
-def create_comparison_template():
+from excel_template_helpers import save_template, set_column_widths
+
+# Column widths for readability
+_COLUMN_WIDTHS = {
+    'A': 25,  # Benefit name column
+    'B': 2,   # First spacer
+    'C': 20,  # Plan 1
+    'D': 2,   # Spacer between Plan 1 and Plan 2
+    'E': 20,  # Plan 2
+    'F': 2,   # Spacer between Plan 2 and Plan 3
+    'G': 20,  # Plan 3
+}
+
+# Spacer columns (B, D, F) and plan value columns (C, E, G)
+_SPACER_COLS = (2, 4, 6)
+_PLAN_COLS = (3, 5, 7)
+
+# Header styling
+_HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+_HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
+_HEADER_ALIGN = Alignment(horizontal="center", vertical="center", wrap_text=True)
+
+# Border
+_BORDER = Border(
+    left=Side(style="thin"),
+    right=Side(style="thin"),
+    top=Side(style="thin"),
+    bottom=Side(style="thin")
+)
+
+# Data styling
+_DATA_FILL = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
+_DATA_FONT = Font(size=10)
+_DATA_ALIGN = Alignment(horizontal="center", vertical="center", wrap_text=True)
+_LEFT_ALIGN = Alignment(horizontal="left", vertical="center")
+
+# (fill, font, alignment, border) bundles applied with _apply()
+_HEADER_STYLE = (_HEADER_FILL, _HEADER_FONT, _HEADER_ALIGN, _BORDER)
+_BENEFIT_STYLE = (_DATA_FILL, _DATA_FONT, _LEFT_ALIGN, _BORDER)
+
+
+COMPARISON_TEMPLATE_PATH = "src/main/resources/common-templates/templates/comparison-template.xlsx"
+
+
+def _apply(cell, fill, font, alignment, border):
+    """Assign a style bundle's shared objects to a cell"""
+    cell.fill = fill
+    cell.font = font
+    cell.alignment = alignment
+    cell.border = border
+
+
+def create_comparison_template(template_path=COMPARISON_TEMPLATE_PATH):
     workbook = openpyxl.Workbook()
     sheet = workbook.active
     sheet.title = "Comparison"
     
     # Set column widths for readability
-    sheet.column_dimensions['A'].width = 25  # Benefit name column
-    sheet.column_dimensions['B'].width = 2   # First spacer
-    sheet.column_dimensions['C'].width = 20  # Plan 1
-    sheet.column_dimensions['D'].width = 2   # Spacer between Plan 1 and Plan 2
-    sheet.column_dimensions['E'].width = 20  # Plan 2
-    sheet.column_dimensions['F'].width = 2   # Spacer between Plan 2 and Plan 3
-    sheet.column_dimensions['G'].width = 20  # Plan 3
-    
-    # Define header styling
-    header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-    header_font = Font(bold=True, color="FFFFFF", size=11)
-    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    
-    # Define border
-    border = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin")
-    )
-    
-    # Define data styling
-    data_fill = PatternFill(start_color="E7E6E6", end_color="E7E6E6", fill_type="solid")
-    data_font = Font(size=10)
-    data_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    set_column_widths(sheet, _COLUMN_WIDTHS)
     
     # Row 1: Header with benefit column and plan names
     headers = ["Benefit", "", "Plan A", "", "Plan B", "", "Plan C"]
     for col_idx, header_text in enumerate(headers, 1):
         cell = sheet.cell(row=1, column=col_idx)
-        cell.value = header_text
-        if header_text and header_text != "":  # Don't style spacer columns
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = header_alignment
-        cell.border = border
+        if header_text:
+            cell.value = header_text
+            _apply(cell, *_HEADER_STYLE)
+        else:  # Spacer columns carry only a border, no value
+            cell.border = _BORDER
     
     # Rows 2-6: Placeholder benefit rows (matrix will fill these)
     placeholder_benefits = [
@@ -65,25 +92,19 @@ def create_comparison_template():
         # Column A: Benefit name
         cell_a = sheet.cell(row=row_idx, column=1)
         cell_a.value = benefit_name
-        cell_a.fill = data_fill
-        cell_a.font = data_font
-        cell_a.alignment = Alignment(horizontal="left", vertical="center")
-        cell_a.border = border
+        _apply(cell_a, *_BENEFIT_STYLE)
         
         # Columns B-G: Data cells (will be filled by matrix mapping)
-        for col_idx in range(2, 8):
+        for col_idx in _SPACER_COLS:
+            sheet.cell(row=row_idx, column=col_idx).border = _BORDER
+        for col_idx in _PLAN_COLS:
             cell = sheet.cell(row=row_idx, column=col_idx)
-            if col_idx % 2 == 0:  # Spacer columns (B, D, F)
-                cell.value = ""
-            else:  # Plan value columns (C, E, G)
-                cell.value = ""  # Placeholder - will be filled
-                cell.alignment = data_alignment
-            cell.border = border
+            cell.alignment = _DATA_ALIGN
+            cell.border = _BORDER
     
     # Save the template
-    template_path = "src/main/resources/common-templates/templates/comparison-template.xlsx"
-    workbook.save(template_path)
-    print(f"✓ Created comparison template: {template_path}")
+    save_template(workbook, template_path)
 
 if __name__ == "__main__":
     create_comparison_template()
+    print(f"✓ Created comparison template: {COMPARISON_TEMPLATE_PATH}")
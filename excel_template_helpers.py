@@ -0,0 +1,40 @@
+"""
+Helpers shared by the Excel template generator scripts
+(create-excel-templates.py and create-plan-comparison-template.py).
+"""
+
+import datetime
+import os
+from zipfile import ZipFile, ZIP_DEFLATED
+
+from openpyxl.worksheet.dimensions import ColumnDimension
+from openpyxl.writer.excel import ExcelWriter
+
+
+def save_template(workbook, path):
+    """
+    Save a workbook like Workbook.save(), but with fast (level 1) Deflate:
+    the templates are tiny, so heavier compression buys nothing.
+
+    The workbook is written to a temporary file next to path and moved into
+    place only once it is complete, so a failed save never leaves a partial
+    template behind.
+    """
+    tmp_path = f"{path}.tmp"
+    # Workbook.save() stamps the modified time; keep docProps/core.xml accurate too
+    workbook.properties.modified = datetime.datetime.now(tz=datetime.timezone.utc).replace(tzinfo=None)
+    try:
+        with ZipFile(tmp_path, 'w', ZIP_DEFLATED, allowZip64=True, compresslevel=1) as archive:
+            ExcelWriter(workbook, archive).write_data()
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def set_column_widths(ws, widths):
+    """Set column widths from a {column letter: width} mapping in one update"""
+    ws.column_dimensions.update(
+        (col, ColumnDimension(ws, index=col, width=width)) for col, width in widths.items()
+    )